@@ -15,6 +15,7 @@
 
 from abc import ABC, abstractmethod
 from collections import OrderedDict
+from collections.abc import Mapping
 from hashlib import sha512
 from typing import Any, Generic, Self, TypeVar
 
@@ -42,6 +43,10 @@ class BaseCache(ABC, Generic[T]):
     async def set(self, key: str, value: T) -> None:
         pass
 
+    async def set_many(self, items: Mapping[str, T]) -> None:
+        for key, value in items.items():
+            await self.set(key, value)
+
     @abstractmethod
     async def get(self, key: str) -> T | None:
         pass
@@ -13,6 +13,7 @@
 # limitations under the License.
 
 
+from collections.abc import Mapping
 from typing import TypeVar
 
 from beeai_framework.cache.base import BaseCache
@@ -31,6 +32,9 @@ class NullCache(BaseCache[T]):
     async def set(self, _key: str, _value: T) -> None:
         pass
 
+    async def set_many(self, _items: Mapping[str, T]) -> None:
+        pass
+
     async def get(self, key: str) -> T | None:
         return None
 
@@ -13,11 +13,13 @@
 # limitations under the License.
 
 
-from copy import copy
+import heapq
+import math
+import time
+from collections import OrderedDict
+from collections.abc import Callable, Mapping
 from typing import Self, TypeVar
 
-from cachetools import Cache, LRUCache, TTLCache
-
 from beeai_framework.cache.base import BaseCache
 
 T = TypeVar("T")
@@ -26,34 +28,88 @@ T = TypeVar("T")
 class SlidingCache(BaseCache[T]):
     """Cache implementation using a sliding window strategy."""
 
-    def __init__(self, size: int, ttl: float | None = None) -> None:
+    def __init__(self, size: int, ttl: float | None = None, *, now: Callable[[], float] = time.monotonic) -> None:
         super().__init__()
+        self._size = size
         self._ttl = ttl
-        self._items: Cache[str, T] = TTLCache(maxsize=size, ttl=ttl) if ttl else LRUCache(maxsize=size)
+        self._now = now
+        # key -> (value, expires_at), kept in least-recently-used-first order
+        self._items: OrderedDict[str, tuple[T, float]] = OrderedDict()
+        # min-heap of (expires_at, key), may contain stale entries for overwritten or deleted keys
+        self._expiry: list[tuple[float, str]] = []
+
+    def _drain_expired(self) -> None:
+        if not self._expiry:
+            return
+
+        now = self._now()
+        while self._expiry and self._expiry[0][0] <= now:
+            _, key = heapq.heappop(self._expiry)
+            item = self._items.get(key)
+            if item is not None and item[1] <= now:
+                del self._items[key]
+
+    def _compact_expiry(self) -> None:
+        self._expiry = [(expires_at, key) for key, (_, expires_at) in self._items.items()]
+        heapq.heapify(self._expiry)
+
+    def _get_live(self, key: str) -> tuple[T, float] | None:
+        item = self._items.get(key)
+        if item is not None and item[1] <= self._now():
+            del self._items[key]
+            return None
+        return item
+
+    def _set(self, key: str, value: T) -> None:
+        if key in self._items:
+            self._items.move_to_end(key)
+        if self._ttl:
+            expires_at = self._now() + self._ttl
+            heapq.heappush(self._expiry, (expires_at, key))
+        else:
+            expires_at = math.inf
+        self._items[key] = (value, expires_at)
+
+        if len(self._items) > self._size:
+            # Expired entries give up their slots before any live entry is evicted
+            self._drain_expired()
+        while len(self._items) > self._size:
+            self._items.popitem(last=False)
+        if len(self._expiry) > 2 * self._size:
+            self._compact_expiry()
 
     async def set(self, key: str, value: T) -> None:
-        self._items[key] = value
+        self._set(key, value)
+
+    async def set_many(self, items: Mapping[str, T]) -> None:
+        for key, value in items.items():
+            self._set(key, value)
 
     async def get(self, key: str) -> T | None:
-        return self._items.get(key, default=None)
+        item = self._get_live(key)
+        if item is None:
+            return None
+
+        self._items.move_to_end(key)
+        return item[0]
 
     async def has(self, key: str) -> bool:
-        return key in self._items
+        return self._get_live(key) is not None
 
     async def delete(self, key: str) -> bool:
-        if not await self.has(key):
-            return False
-
-        self._items.pop(key)
-        return True
+        item = self._items.pop(key, None)
+        return item is not None and item[1] > self._now()
 
     async def clear(self) -> None:
         self._items.clear()
+        self._expiry.clear()
 
     async def size(self) -> int:
+        self._drain_expired()
         return len(self._items)
 
     async def clone(self) -> Self:
-        cloned = type(self)(len(self._items), self._ttl)
-        cloned._items = copy(self._items)
+        cloned = type(self)(self._size, self._ttl, now=self._now)
+        cloned._items = self._items.copy()
+        cloned._expiry = self._expiry.copy()
         return cloned
@@ -13,12 +13,15 @@
 # limitations under the License.
 
 
+from collections.abc import Mapping
 from typing import Self, TypeVar
 
 from beeai_framework.cache.base import BaseCache
 
 T = TypeVar("T")
 
+_MISSING = object()
+
 
 class UnconstrainedCache(BaseCache[T]):
     """Cache implementation without constraints."""
@@ -33,6 +36,9 @@ class UnconstrainedCache(BaseCache[T]):
     async def set(self, key: str, value: T) -> None:
         self._provider[key] = value
 
+    async def set_many(self, items: Mapping[str, T]) -> None:
+        self._provider.update(items)
+
     async def get(self, key: str) -> T | None:
         return self._provider.get(key)
 
@@ -40,11 +46,7 @@ class UnconstrainedCache(BaseCache[T]):
         return key in self._provider
 
     async def delete(self, key: str) -> bool:
-        if not await self.has(key):
-            return False
-
-        self._provider.pop(key)
-        return True
+        return self._provider.pop(key, _MISSING) is not _MISSING
 
     async def clear(self) -> None:
         self._provider.clear()
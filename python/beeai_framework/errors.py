@@ -19,12 +19,20 @@ from typing import Any, Self
 
 from httpx import HTTPStatusError
 
+_qualified_error_names: dict[type[BaseException], str] = {}
+
+
+def _qualified_error_name(cls: type[BaseException]) -> str:
+    name = _qualified_error_names.get(cls)
+    if name is None:
+        name = _qualified_error_names[cls] = f"{cls.__name__}({cls.__module__})"
+    return name
+
 
 def _format_error_message(e: BaseException, *, offset: int = 0, strip_traceback: bool = True) -> str:
-    cls = type(e).__name__
-    module = type(e).__module__
+    name = _qualified_error_name(type(e))
     prefix = "  " * offset
-    formatted = f"{cls}({module}): {e!s}"
+    formatted = f"{name}: {e!s}"
     if isinstance(e, FrameworkError) and e.context:
         try:
             # Directly use json.dumps, with sort_keys for consistent output.
@@ -34,7 +42,7 @@ def _format_error_message(e: BaseException, *, offset: int = 0, strip_traceback:
             # Handle serialization errors gracefully.
             formatted += f'\n{prefix}Context: "Cannot serialize context to JSON"'
     elif isinstance(e, HTTPStatusError):
-        formatted = f"{cls}({module}): {e.response.reason_phrase} ({e.response.status_code}) for {e.response.url}"
+        formatted = f"{name}: {e.response.reason_phrase} ({e.response.status_code}) for {e.response.url}"
         formatted += f"\n{prefix}Response: {e.response.text}"
 
     if strip_traceback:
@@ -90,30 +98,31 @@ class FrameworkError(Exception):
         """get name (class) of this error"""
         return type(self).__name__
 
-    def has_fatal_error(self) -> bool:
-        current_exception: BaseException | None = self
-
-        while current_exception is not None:
-            if FrameworkError.is_fatal(current_exception):
-                return True
+    def _walk(self) -> tuple[BaseException, bool]:
+        # Walks the __cause__ chain once, returning the root cause and whether any error along the way is fatal.
+        current: BaseException = self
+        fatal = False
+        while True:
+            fatal = fatal or FrameworkError.is_fatal(current)
+            cause = current.__cause__
+            if cause is None or cause is current:
+                return current, fatal
+            current = cause
 
-            current_exception = current_exception.__cause__
-
-        return False
+    def has_fatal_error(self) -> bool:
+        return self._walk()[1]
 
     def traverse(self) -> Generator["FrameworkError", None, None]:
-        next: FrameworkError | BaseException | None = self  # Use | for union
-        while isinstance(next, FrameworkError):
-            yield next
-            next = next.predecessor
+        current: BaseException | None = self
+        while isinstance(current, FrameworkError):
+            yield current
+            predecessor = current.predecessor
+            if predecessor is current:
+                break
+            current = predecessor
 
     def get_cause(self) -> BaseException:
-        deepest_cause: BaseException = self
-
-        while deepest_cause.__cause__ is not None:
-            deepest_cause = deepest_cause.__cause__
-
-        return deepest_cause
+        return self._walk()[0]
 
     def explain(self) -> str:
         output = []
@@ -0,0 +1,27 @@
+# Copyright 2025 © BeeAI a Series of LF Projects, LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from typing import TYPE_CHECKING
+
+import pytest
+
+if TYPE_CHECKING:
+    from beeai_framework.adapters.azure_openai import AzureOpenAIChatModel
+
+
+@pytest.fixture(scope="module")
+def azure_openai_cls() -> type["AzureOpenAIChatModel"]:
+    from beeai_framework.adapters.azure_openai import AzureOpenAIChatModel
+
+    return AzureOpenAIChatModel
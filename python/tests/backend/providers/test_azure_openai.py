@@ -13,180 +13,174 @@
 # limitations under the License.
 
 
+from typing import TYPE_CHECKING, Any
+
 import pytest
 
-from beeai_framework.adapters.azure_openai import AzureOpenAIChatModel
+if TYPE_CHECKING:
+    from beeai_framework.adapters.azure_openai import AzureOpenAIChatModel
+
+_AZURE_ENV = (
+    "AZURE_OPENAI_API_KEY",
+    "AZURE_API_KEY",
+    "AZURE_OPENAI_API_BASE",
+    "AZURE_API_BASE",
+    "AZURE_OPENAI_API_VERSION",
+    "AZURE_API_VERSION",
+)
+_SETTINGS = {
+    "api_key": "settings_api_key",
+    "base_url": "settings_api_base",
+    "api_version": "settings_api_version",
+}
+_ALIAS_AZURE_ENV = {
+    "AZURE_API_KEY": "env_api_key",
+    "AZURE_API_BASE": "env_api_base",
+    "AZURE_API_VERSION": "env_api_version",
+}
+_ALL_AZURE_ENV = {
+    "AZURE_OPENAI_API_KEY": "env_openai_api_key",
+    "AZURE_OPENAI_API_BASE": "env_openai_api_base",
+    "AZURE_OPENAI_API_VERSION": "env_openai_api_version",
+    **_ALIAS_AZURE_ENV,
+}
 
 
 class TestAzureOpenAIChatModel:
     """Unit tests for the AzureOpenAIChatModel class."""
 
-    @pytest.mark.unit
-    def test_init_with_settings(self, monkeypatch: pytest.MonkeyPatch) -> None:
-        """Test initialization with settings."""
-        monkeypatch.delenv("AZURE_OPENAI_API_KEY", raising=False)
-        monkeypatch.delenv("AZURE_API_KEY", raising=False)
-        monkeypatch.delenv("AZURE_OPENAI_API_BASE", raising=False)
-        monkeypatch.delenv("AZURE_API_BASE", raising=False)
-        monkeypatch.delenv("AZURE_OPENAI_API_VERSION", raising=False)
-        monkeypatch.delenv("AZURE_API_VERSION", raising=False)
-        settings = {
-            "api_key": "test_api_key",
-            "base_url": "test_api_base",
-            "api_version": "test_api_version",
-        }
-        model = AzureOpenAIChatModel(model_id="gpt-4o", settings=settings)
-
-        assert model._settings["api_key"] == "test_api_key"
-        assert model._settings["base_url"] == "test_api_base"
-        assert model._settings["api_version"] == "test_api_version"
-        assert model.model_id == "gpt-4o"
-        assert model._litellm_provider_id == "azure"
-
-    @pytest.mark.unit
-    def test_init_with_env_vars(self, monkeypatch: pytest.MonkeyPatch) -> None:
-        """Test initialization with environment variables."""
-        monkeypatch.delenv("AZURE_OPENAI_API_KEY", raising=False)
-        monkeypatch.delenv("AZURE_API_KEY", raising=False)
-        monkeypatch.delenv("AZURE_OPENAI_API_BASE", raising=False)
-        monkeypatch.delenv("AZURE_API_BASE", raising=False)
-        monkeypatch.delenv("AZURE_OPENAI_API_VERSION", raising=False)
-        monkeypatch.delenv("AZURE_API_VERSION", raising=False)
-        monkeypatch.setenv("AZURE_OPENAI_API_KEY", "env_api_key")
-        monkeypatch.setenv("AZURE_OPENAI_API_BASE", "env_api_base")
-        monkeypatch.setenv("AZURE_OPENAI_API_VERSION", "env_api_version")
-
-        model = AzureOpenAIChatModel(model_id="gpt-4o")
-
-        assert model._settings["api_key"] == "env_api_key"
-        assert model._settings["base_url"] == "env_api_base"
-        assert model._settings["api_version"] == "env_api_version"
-        assert model.model_id == "gpt-4o"
-
-    @pytest.mark.unit
-    def test_init_with_alias_env_vars(self, monkeypatch: pytest.MonkeyPatch) -> None:
-        """Test initialization with alias environment variables."""
-        monkeypatch.delenv("AZURE_OPENAI_API_KEY", raising=False)
-        monkeypatch.delenv("AZURE_API_KEY", raising=False)
-        monkeypatch.delenv("AZURE_OPENAI_API_BASE", raising=False)
-        monkeypatch.delenv("AZURE_API_BASE", raising=False)
-        monkeypatch.delenv("AZURE_OPENAI_API_VERSION", raising=False)
-        monkeypatch.delenv("AZURE_API_VERSION", raising=False)
-        monkeypatch.setenv("AZURE_API_KEY", "env_api_key")
-        monkeypatch.setenv("AZURE_API_BASE", "env_api_base")
-        monkeypatch.setenv("AZURE_API_VERSION", "env_api_version")
-
-        model = AzureOpenAIChatModel(model_id="gpt-4o")
-
-        assert model._settings["api_key"] == "env_api_key"
-        assert model._settings["base_url"] == "env_api_base"
-        assert model._settings["api_version"] == "env_api_version"
-
-    @pytest.mark.unit
-    def test_init_with_mixed_env_vars(self, monkeypatch: pytest.MonkeyPatch) -> None:
-        """Test initialization with mixed environment variables."""
-        monkeypatch.delenv("AZURE_OPENAI_API_KEY", raising=False)
-        monkeypatch.delenv("AZURE_API_KEY", raising=False)
-        monkeypatch.delenv("AZURE_OPENAI_API_BASE", raising=False)
-        monkeypatch.delenv("AZURE_API_BASE", raising=False)
-        monkeypatch.delenv("AZURE_OPENAI_API_VERSION", raising=False)
-        monkeypatch.delenv("AZURE_API_VERSION", raising=False)
-        monkeypatch.setenv("AZURE_OPENAI_API_KEY", "env_openai_api_key")
-        monkeypatch.setenv("AZURE_API_BASE", "env_api_base")
-        monkeypatch.setenv("AZURE_API_VERSION", "env_api_version")
-
-        model = AzureOpenAIChatModel(model_id="gpt-4o")
-
-        assert model._settings["api_key"] == "env_openai_api_key"
-        assert model._settings["base_url"] == "env_api_base"
-        assert model._settings["api_version"] == "env_api_version"
+    @pytest.fixture(autouse=True)
+    def _clean_azure_env(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        for name in _AZURE_ENV:
+            monkeypatch.delenv(name, raising=False)
 
     @pytest.mark.unit
-    def test_init_with_no_config(self, monkeypatch: pytest.MonkeyPatch) -> None:
-        """Test initialization with no configuration."""
-        monkeypatch.delenv("AZURE_OPENAI_API_KEY", raising=False)
-        monkeypatch.delenv("AZURE_API_KEY", raising=False)
-        monkeypatch.delenv("AZURE_OPENAI_API_BASE", raising=False)
-        monkeypatch.delenv("AZURE_API_BASE", raising=False)
-        monkeypatch.delenv("AZURE_OPENAI_API_VERSION", raising=False)
-        monkeypatch.delenv("AZURE_API_VERSION", raising=False)
-
-        with pytest.raises(ValueError, match="Setting api_key is required for AzureOpenAIChatModel"):
-            AzureOpenAIChatModel(model_id="gpt-4o")
-        monkeypatch.setenv("AZURE_API_KEY", "env_api_key")
-
-        with pytest.raises(ValueError, match="Setting base_url is required for AzureOpenAIChatModel"):
-            AzureOpenAIChatModel(model_id="gpt-4o")
-
-        monkeypatch.setenv("AZURE_API_BASE", "env_api_base")
-        with pytest.raises(ValueError, match="Setting api_version is required for AzureOpenAIChatModel"):
-            AzureOpenAIChatModel(model_id="gpt-4o")
-
-    @pytest.mark.unit
-    def test_settings_precedence(self, monkeypatch: pytest.MonkeyPatch) -> None:
-        """Test precedence order: settings > env vars > alias env vars."""
-        monkeypatch.delenv("AZURE_OPENAI_API_KEY", raising=False)
-        monkeypatch.delenv("AZURE_API_KEY", raising=False)
-        monkeypatch.delenv("AZURE_OPENAI_API_BASE", raising=False)
-        monkeypatch.delenv("AZURE_API_BASE", raising=False)
-        monkeypatch.delenv("AZURE_OPENAI_API_VERSION", raising=False)
-        monkeypatch.delenv("AZURE_API_VERSION", raising=False)
-        monkeypatch.setenv("AZURE_OPENAI_API_KEY", "env_openai_api_key")
-        monkeypatch.setenv("AZURE_API_KEY", "env_api_key")
-        monkeypatch.setenv("AZURE_OPENAI_API_BASE", "env_openai_api_base")
-        monkeypatch.setenv("AZURE_API_BASE", "env_api_base")
-        monkeypatch.setenv("AZURE_OPENAI_API_VERSION", "env_openai_api_version")
-        monkeypatch.setenv("AZURE_API_VERSION", "env_api_version")
-        settings = {
-            "api_key": "settings_api_key",
-            "base_url": "settings_api_base",
-            "api_version": "settings_api_version",
-        }
-        model = AzureOpenAIChatModel(model_id="gpt-4o", settings=settings)
-
-        assert model._settings["api_key"] == "settings_api_key"
-        assert model._settings["base_url"] == "settings_api_base"
-        assert model._settings["api_version"] == "settings_api_version"
-
-    @pytest.mark.unit
-    def test_env_var_precedence(self, monkeypatch: pytest.MonkeyPatch) -> None:
-        """Test precedence order for environment variables: AZURE_OPENAI > AZURE."""
-        monkeypatch.delenv("AZURE_OPENAI_API_KEY", raising=False)
-        monkeypatch.delenv("AZURE_API_KEY", raising=False)
-        monkeypatch.delenv("AZURE_OPENAI_API_BASE", raising=False)
-        monkeypatch.delenv("AZURE_API_BASE", raising=False)
-        monkeypatch.delenv("AZURE_OPENAI_API_VERSION", raising=False)
-        monkeypatch.delenv("AZURE_API_VERSION", raising=False)
-        monkeypatch.setenv("AZURE_OPENAI_API_KEY", "env_openai_api_key")
-        monkeypatch.setenv("AZURE_API_KEY", "env_api_key")
-        monkeypatch.setenv("AZURE_OPENAI_API_BASE", "env_openai_api_base")
-        monkeypatch.setenv("AZURE_API_BASE", "env_api_base")
-        monkeypatch.setenv("AZURE_OPENAI_API_VERSION", "env_openai_api_version")
-        monkeypatch.setenv("AZURE_API_VERSION", "env_api_version")
-
-        model = AzureOpenAIChatModel(model_id="gpt-4o")
-
-        assert model._settings["api_key"] == "env_openai_api_key"
-        assert model._settings["base_url"] == "env_openai_api_base"
-        assert model._settings["api_version"] == "env_openai_api_version"
-
-    @pytest.mark.unit
-    def test_default_model_id(self, monkeypatch: pytest.MonkeyPatch) -> None:
-        """Test default model ID when not provided."""
-        monkeypatch.delenv("AZURE_OPENAI_API_KEY", raising=False)
-        monkeypatch.delenv("AZURE_API_KEY", raising=False)
-        monkeypatch.delenv("AZURE_OPENAI_API_BASE", raising=False)
-        monkeypatch.delenv("AZURE_API_BASE", raising=False)
-        monkeypatch.delenv("AZURE_OPENAI_API_VERSION", raising=False)
-        monkeypatch.delenv("AZURE_API_VERSION", raising=False)
-        monkeypatch.setenv("AZURE_API_KEY", "env_api_key")
-        monkeypatch.setenv("AZURE_API_BASE", "env_api_base")
-        monkeypatch.setenv("AZURE_API_VERSION", "env_api_version")
-
-        model = AzureOpenAIChatModel()
-
-        assert model.model_id == "gpt-4o-mini"
-
-        monkeypatch.setenv("AZURE_OPENAI_CHAT_MODEL", "new_model")
-        model = AzureOpenAIChatModel()
-        assert model.model_id == "new_model"
+    @pytest.mark.parametrize(
+        "kwargs,env,expected,raises",
+        [
+            pytest.param(
+                {"model_id": "gpt-4o", "settings": _SETTINGS},
+                {},
+                {**_SETTINGS, "model_id": "gpt-4o"},
+                None,
+                id="settings",
+            ),
+            pytest.param(
+                {"model_id": "gpt-4o"},
+                {
+                    "AZURE_OPENAI_API_KEY": "env_api_key",
+                    "AZURE_OPENAI_API_BASE": "env_api_base",
+                    "AZURE_OPENAI_API_VERSION": "env_api_version",
+                },
+                {
+                    "api_key": "env_api_key",
+                    "base_url": "env_api_base",
+                    "api_version": "env_api_version",
+                    "model_id": "gpt-4o",
+                },
+                None,
+                id="env_vars",
+            ),
+            pytest.param(
+                {"model_id": "gpt-4o"},
+                {
+                    "AZURE_API_KEY": "env_api_key",
+                    "AZURE_API_BASE": "env_api_base",
+                    "AZURE_API_VERSION": "env_api_version",
+                },
+                {"api_key": "env_api_key", "base_url": "env_api_base", "api_version": "env_api_version"},
+                None,
+                id="alias_env_vars",
+            ),
+            pytest.param(
+                {"model_id": "gpt-4o"},
+                {
+                    "AZURE_OPENAI_API_KEY": "env_openai_api_key",
+                    "AZURE_API_BASE": "env_api_base",
+                    "AZURE_API_VERSION": "env_api_version",
+                },
+                {"api_key": "env_openai_api_key", "base_url": "env_api_base", "api_version": "env_api_version"},
+                None,
+                id="mixed_env_vars",
+            ),
+            pytest.param(
+                {"model_id": "gpt-4o"},
+                {},
+                {},
+                "Setting api_key is required for AzureOpenAIChatModel",
+                id="no_config",
+            ),
+            pytest.param(
+                {"model_id": "gpt-4o"},
+                {"AZURE_API_KEY": "env_api_key"},
+                {},
+                "Setting base_url is required for AzureOpenAIChatModel",
+                id="no_base_url",
+            ),
+            pytest.param(
+                {"model_id": "gpt-4o"},
+                {"AZURE_API_KEY": "env_api_key", "AZURE_API_BASE": "env_api_base"},
+                {},
+                "Setting api_version is required for AzureOpenAIChatModel",
+                id="no_api_version",
+            ),
+            pytest.param(
+                {"model_id": "gpt-4o", "settings": _SETTINGS},
+                _ALL_AZURE_ENV,
+                _SETTINGS,
+                None,
+                id="settings_precedence",
+            ),
+            pytest.param(
+                {"model_id": "gpt-4o"},
+                _ALL_AZURE_ENV,
+                {
+                    "api_key": "env_openai_api_key",
+                    "base_url": "env_openai_api_base",
+                    "api_version": "env_openai_api_version",
+                },
+                None,
+                id="env_var_precedence",
+            ),
+            pytest.param(
+                {},
+                _ALIAS_AZURE_ENV,
+                {"model_id": "gpt-4o-mini"},
+                None,
+                id="default_model_id",
+            ),
+            pytest.param(
+                {},
+                {**_ALIAS_AZURE_ENV, "AZURE_OPENAI_CHAT_MODEL": "new_model"},
+                {"model_id": "new_model"},
+                None,
+                id="default_model_id_from_env",
+            ),
+        ],
+    )
+    def test_init(
+        self,
+        monkeypatch: pytest.MonkeyPatch,
+        azure_openai_cls: type["AzureOpenAIChatModel"],
+        kwargs: dict[str, Any],
+        env: dict[str, str],
+        expected: dict[str, str],
+        raises: str | None,
+    ) -> None:
+        """Test initialization from settings and environment variables, including their precedence."""
+        for name, value in env.items():
+            monkeypatch.setenv(name, value)
+        if "settings" in kwargs:
+            # the model writes resolved values back into its settings, keep the shared constant intact
+            kwargs = {**kwargs, "settings": {**kwargs["settings"]}}
+
+        if raises is not None:
+            with pytest.raises(ValueError, match=raises):
+                azure_openai_cls(**kwargs)
+            return
+
+        model = azure_openai_cls(**kwargs)
+        assert model._litellm_provider_id == "azure"
+        for key, value in expected.items():
+            actual = model.model_id if key == "model_id" else model._settings[key]
+            assert actual == value
@@ -13,7 +13,6 @@
 # limitations under the License.
 
 import os
-from unittest.mock import patch
 
 import pytest
 
@@ -48,53 +47,53 @@ class TestParseExtraHeaders:
         assert result == {}
 
     @pytest.mark.unit
-    def test_env_headers(self) -> None:
+    def test_env_headers(self, monkeypatch: pytest.MonkeyPatch) -> None:
         """
         Test when extra headers are provided as an environment variable.
         Simple usage, avoiding any code change
         """
-        with patch.dict(os.environ, {"LITELLM_EXTRA_HEADERS": "header1=value1, header2=value2"}):
-            result = utils.parse_extra_headers(None, os.environ.get("LITELLM_EXTRA_HEADERS"))
-            assert result == {"header1": "value1", "header2": "value2"}
+        monkeypatch.setenv("LITELLM_EXTRA_HEADERS", "header1=value1, header2=value2")
+        result = utils.parse_extra_headers(None, os.environ["LITELLM_EXTRA_HEADERS"])
+        assert result == {"header1": "value1", "header2": "value2"}
 
     @pytest.mark.unit
-    def test_settings_override_env(self) -> None:
+    def test_settings_override_env(self, monkeypatch: pytest.MonkeyPatch) -> None:
         """
         Test that existing settings override the environment variables.
         """
         settings_headers = {"header1": "new_value1", "header3": "value3"}
-        with patch.dict(os.environ, {"ENV_VAR": "header1=value1, header2=value2"}):
-            result = utils.parse_extra_headers(settings_headers, os.environ.get("ENV_VAR"))
-            assert result == {"header1": "new_value1", "header3": "value3"}
+        monkeypatch.setenv("ENV_VAR", "header1=value1, header2=value2")
+        result = utils.parse_extra_headers(settings_headers, os.environ["ENV_VAR"])
+        assert result == {"header1": "new_value1", "header3": "value3"}
 
     @pytest.mark.unit
-    def test_env_headers_with_spaces(self) -> None:
+    def test_env_headers_with_spaces(self, monkeypatch: pytest.MonkeyPatch) -> None:
         """Test when environment variable has extra spaces."""
-        with patch.dict(os.environ, {"ENV_VAR": " header1 = value1 , header2= value2 "}):
-            result = utils.parse_extra_headers(None, os.environ.get("ENV_VAR"))
-            assert result == {"header1": "value1", "header2": "value2"}
+        monkeypatch.setenv("ENV_VAR", " header1 = value1 , header2= value2 ")
+        result = utils.parse_extra_headers(None, os.environ["ENV_VAR"])
+        assert result == {"header1": "value1", "header2": "value2"}
 
     @pytest.mark.unit
-    def test_invalid_headers_string_format(self) -> None:
+    def test_invalid_headers_string_format(self, monkeypatch: pytest.MonkeyPatch) -> None:
         """
         Test when a malformed header string is passed.
         Expected behaviour is that only correct key=value pairs are parsed.
         """
-        with patch.dict(os.environ, {"ENV_VAR": "header1=value1,header2value2"}):
-            result = utils.parse_extra_headers(None, os.environ.get("ENV_VAR"))
-            assert result == {"header1": "value1"}
+        monkeypatch.setenv("ENV_VAR", "header1=value1,header2value2")
+        result = utils.parse_extra_headers(None, os.environ["ENV_VAR"])
+        assert result == {"header1": "value1"}
 
     @pytest.mark.unit
-    def test_empty_header_string(self) -> None:
+    def test_empty_header_string(self, monkeypatch: pytest.MonkeyPatch) -> None:
         """Test when environment variable is empty or whitespace."""
 
-        with patch.dict(os.environ, {"ENV_VAR": ""}):
-            result = utils.parse_extra_headers(None, os.environ.get("ENV_VAR"))
-            assert result == {}
+        monkeypatch.setenv("ENV_VAR", "")
+        result = utils.parse_extra_headers(None, os.environ["ENV_VAR"])
+        assert result == {}
 
-        with patch.dict(os.environ, {"ENV_VAR": "    "}):
-            result = utils.parse_extra_headers(None, os.environ.get("ENV_VAR"))
-            assert result == {}
+        monkeypatch.setenv("ENV_VAR", "    ")
+        result = utils.parse_extra_headers(None, os.environ["ENV_VAR"])
+        assert result == {}
 
     @pytest.mark.unit
     def test_settings_headers_none(self) -> None:
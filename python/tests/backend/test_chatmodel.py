@@ -14,21 +14,12 @@
 
 import asyncio
 from collections.abc import AsyncGenerator
+from importlib import import_module
 from typing import Any
 
 import pytest
-import pytest_asyncio
 from pydantic import BaseModel
 
-from beeai_framework.adapters.amazon_bedrock import AmazonBedrockChatModel
-from beeai_framework.adapters.anthropic import AnthropicChatModel
-from beeai_framework.adapters.azure_openai import AzureOpenAIChatModel
-from beeai_framework.adapters.groq import GroqChatModel
-from beeai_framework.adapters.ollama import OllamaChatModel
-from beeai_framework.adapters.openai import OpenAIChatModel
-from beeai_framework.adapters.vertexai import VertexAIChatModel
-from beeai_framework.adapters.watsonx import WatsonxChatModel
-from beeai_framework.adapters.xai import XAIChatModel
 from beeai_framework.backend import (
     AnyMessage,
     AssistantMessage,
@@ -41,7 +32,7 @@ from beeai_framework.backend import (
 from beeai_framework.backend.types import ChatModelInput, ChatModelStructureInput
 from beeai_framework.context import RunContext
 from beeai_framework.errors import AbortError
-from beeai_framework.utils import AbortSignal
+from beeai_framework.utils import AbortController
 
 """
 Utility functions and classes
@@ -53,41 +44,38 @@ class ReverseWordsDummyModel(ChatModel):
 
     model_id = "reversed_words_model"
     provider_id = "ollama"
+    chunk_delay = 0.01
 
-    def reverse_message_words(self, messages: list[AnyMessage]) -> list[str]:
-        reversed_words_messages = []
-        for message in messages:
-            if isinstance(message, UserMessage):
-                reversed_words = " ".join(word[::-1] for word in message.text.split())
-                reversed_words_messages.append(reversed_words)
-        return reversed_words_messages
+    def reverse_message_words(self, messages: list[AnyMessage]) -> list[list[str]]:
+        return [
+            [word[::-1] for word in message.text.split()] for message in messages if isinstance(message, UserMessage)
+        ]
 
     async def _create(self, input: ChatModelInput, _: RunContext) -> ChatModelOutput:
         reversed_words_messages = self.reverse_message_words(input.messages)
-        return ChatModelOutput(messages=[AssistantMessage(w) for w in reversed_words_messages])
+        return ChatModelOutput(messages=[AssistantMessage(" ".join(words)) for words in reversed_words_messages])
 
     async def _create_stream(self, input: ChatModelInput, context: RunContext) -> AsyncGenerator[ChatModelOutput]:
-        words = self.reverse_message_words(input.messages)[0].split(" ")
+        words = self.reverse_message_words(input.messages)[0]
 
         last = len(words) - 1
         for count, chunk in enumerate(words):
-            if context.signal.aborted:
-                break
-            await asyncio.sleep(5)
+            context.signal.throw_if_aborted()
+            await asyncio.sleep(self.chunk_delay)
             yield ChatModelOutput(messages=[AssistantMessage(f"{chunk} " if count != last else chunk)])
 
     async def _create_structure(self, input: ChatModelStructureInput[Any], run: RunContext) -> ChatModelStructureOutput:
         reversed_words_messages = self.reverse_message_words(input.messages)
-        response_object = {"reversed": "".join(reversed_words_messages)}
+        response_object = {"reversed": "".join(" ".join(words) for words in reversed_words_messages)}
         return ChatModelStructureOutput(object=response_object)
 
 
-@pytest_asyncio.fixture
+@pytest.fixture(scope="module")
 def reverse_words_chat() -> ChatModel:
     return ReverseWordsDummyModel()
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def chat_messages_list() -> list[AnyMessage]:
     user_message = UserMessage("tell me something interesting")
     custom_message = CustomMessage(role="custom", content="this is a custom message")
@@ -99,7 +87,7 @@ Unit Tests
 """
 
 
-@pytest.mark.asyncio
+@pytest.mark.asyncio(loop_scope="module")
 @pytest.mark.unit
 async def test_chat_model_create(reverse_words_chat: ChatModel, chat_messages_list: list[AnyMessage]) -> None:
     response = await reverse_words_chat.create(messages=chat_messages_list)
@@ -109,19 +97,18 @@ async def test_chat_model_create(reverse_words_chat: ChatModel, chat_messages_li
     assert response.messages[0].get_texts()[0].text == "llet em gnihtemos gnitseretni"
 
 
-@pytest.mark.asyncio
+@pytest.mark.asyncio(loop_scope="module")
 @pytest.mark.unit
 async def test_chat_model_structure(reverse_words_chat: ChatModel, chat_messages_list: list[AnyMessage]) -> None:
     class ReverseWordsSchema(BaseModel):
         reversed: str
 
-    reverse_words_chat = ReverseWordsDummyModel()
     response = await reverse_words_chat.create_structure(schema=ReverseWordsSchema, messages=chat_messages_list)
 
     ReverseWordsSchema.model_validate(response.object)
 
 
-@pytest.mark.asyncio
+@pytest.mark.asyncio(loop_scope="module")
 @pytest.mark.unit
 async def test_chat_model_stream(reverse_words_chat: ChatModel, chat_messages_list: list[AnyMessage]) -> None:
     response = await reverse_words_chat.create(messages=chat_messages_list, stream=True)
@@ -131,19 +118,24 @@ async def test_chat_model_stream(reverse_words_chat: ChatModel, chat_messages_li
     assert "".join([m.get_texts()[0].text for m in response.messages]) == "llet em gnihtemos gnitseretni"
 
 
-@pytest.mark.asyncio
+@pytest.mark.asyncio(loop_scope="module")
 @pytest.mark.unit
 async def test_chat_model_abort(reverse_words_chat: ChatModel, chat_messages_list: list[AnyMessage]) -> None:
+    controller = AbortController()
+    controller.abort()
     with pytest.raises(AbortError):
         await reverse_words_chat.create(
             messages=chat_messages_list,
             stream=True,
-            abort_signal=AbortSignal.timeout(1),
+            abort_signal=controller.signal,
         )
 
 
 @pytest.mark.unit
-def test_chat_model_from(monkeypatch: pytest.MonkeyPatch) -> None:
+def test_chat_model_from_settings(monkeypatch: pytest.MonkeyPatch) -> None:
+    from beeai_framework.adapters.ollama import OllamaChatModel
+    from beeai_framework.adapters.watsonx import WatsonxChatModel
+
     # Ollama with Llama model and base_url specified in code
     ollama_chat_model = ChatModel.from_name("ollama:llama3.1", {"base_url": "http://somewhere:12345"})
     assert isinstance(ollama_chat_model, OllamaChatModel)
@@ -169,39 +161,56 @@ def test_chat_model_from(monkeypatch: pytest.MonkeyPatch) -> None:
     assert watsonx_chat_model._settings["project_id"] == "proj_id_123"
     assert watsonx_chat_model._settings["api_key"] == "api_key_123"
 
-    # Watsonx with Granite model and settings specified in env vars
-    monkeypatch.setenv("WATSONX_URL", "http://somewhere-else")
-    monkeypatch.setenv("WATSONX_PROJECT_ID", "proj_id_456")
-    monkeypatch.setenv("WATSONX_API_KEY", "api_key_456")
-
-    watsonx_chat_model = ChatModel.from_name("watsonx:ibm/granite-3-8b-instruct")
-    assert isinstance(watsonx_chat_model, WatsonxChatModel)
-
-    openai_chat_model = ChatModel.from_name("openai:gpt-4o", api_key="test")
-    assert isinstance(openai_chat_model, OpenAIChatModel)
-
-    groq_chat_model = ChatModel.from_name("groq:gemma2-9b-it", api_key="test")
-    assert isinstance(groq_chat_model, GroqChatModel)
-
-    xai_chat_model = ChatModel.from_name("xai:grok-2", api_key="test")
-    assert isinstance(xai_chat_model, XAIChatModel)
 
-    monkeypatch.setenv("GOOGLE_VERTEX_PROJECT", "myproject")
-    vertexai_chat_model = ChatModel.from_name("vertexai:gemini-2.0-flash-lite-001", vertexai_location="test")
-    assert isinstance(vertexai_chat_model, VertexAIChatModel)
-
-    monkeypatch.setenv("ANTHROPIC_API_KEY", "apikey")
-    anthropic_chat_model = ChatModel.from_name("anthropic:claude-3-haiku-20240307")
-    assert isinstance(anthropic_chat_model, AnthropicChatModel)
-
-    monkeypatch.setenv("AWS_ACCESS_KEY_ID", "secret1")
-    monkeypatch.setenv("AWS_SECRET_ACCESS_KEY", "secret2")
-    monkeypatch.setenv("AWS_REGION", "region1")
-    amazon_bedrock_chat_model = ChatModel.from_name("amazon_bedrock:meta.llama3-8b-instruct-v1:0")
-    assert isinstance(amazon_bedrock_chat_model, AmazonBedrockChatModel)
-
-    monkeypatch.setenv("AZURE_API_KEY", "secret")
-    monkeypatch.setenv("AZURE_API_BASE", "base")
-    monkeypatch.setenv("AZURE_API_VERSION", "version")
-    azure_openai_chat_model = ChatModel.from_name("azure_openai:gpt-4o")
-    assert isinstance(azure_openai_chat_model, AzureOpenAIChatModel)
+@pytest.mark.unit
+@pytest.mark.parametrize(
+    "name,kwargs,env,expected_cls",
+    [
+        (
+            "watsonx:ibm/granite-3-8b-instruct",
+            {},
+            {
+                "WATSONX_URL": "http://somewhere-else",
+                "WATSONX_PROJECT_ID": "proj_id_456",
+                "WATSONX_API_KEY": "api_key_456",
+            },
+            "WatsonxChatModel",
+        ),
+        ("openai:gpt-4o", {"api_key": "test"}, {}, "OpenAIChatModel"),
+        ("groq:gemma2-9b-it", {"api_key": "test"}, {}, "GroqChatModel"),
+        ("xai:grok-2", {"api_key": "test"}, {}, "XAIChatModel"),
+        (
+            "vertexai:gemini-2.0-flash-lite-001",
+            {"vertexai_location": "test"},
+            {"GOOGLE_VERTEX_PROJECT": "myproject"},
+            "VertexAIChatModel",
+        ),
+        ("anthropic:claude-3-haiku-20240307", {}, {"ANTHROPIC_API_KEY": "apikey"}, "AnthropicChatModel"),
+        (
+            "amazon_bedrock:meta.llama3-8b-instruct-v1:0",
+            {},
+            {"AWS_ACCESS_KEY_ID": "secret1", "AWS_SECRET_ACCESS_KEY": "secret2", "AWS_REGION": "region1"},
+            "AmazonBedrockChatModel",
+        ),
+        (
+            "azure_openai:gpt-4o",
+            {},
+            {"AZURE_API_KEY": "secret", "AZURE_API_BASE": "base", "AZURE_API_VERSION": "version"},
+            "AzureOpenAIChatModel",
+        ),
+    ],
+)
+def test_chat_model_from(
+    monkeypatch: pytest.MonkeyPatch,
+    name: str,
+    kwargs: dict[str, Any],
+    env: dict[str, str],
+    expected_cls: str,
+) -> None:
+    for key, value in env.items():
+        monkeypatch.setenv(key, value)
+
+    # Resolve the adapter lazily so only the provider under test gets imported
+    adapter = import_module(f"beeai_framework.adapters.{name.split(':', maxsplit=1)[0]}")
+    chat_model = ChatModel.from_name(name, **kwargs)
+    assert isinstance(chat_model, getattr(adapter, expected_cls))
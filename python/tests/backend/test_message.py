@@ -13,76 +13,66 @@
 # limitations under the License.
 
 import json
+from typing import Any
 
 import pytest
+from pydantic import BaseModel
 
 from beeai_framework.backend import (
+    AnyMessage,
     AssistantMessage,
     CustomMessage,
+    CustomMessageContent,
     MessageTextContent,
     SystemMessage,
     ToolMessage,
     UserMessage,
 )
 
+_TEXTS = {
+    "user": "this is a user message",
+    "system": "this is a system message",
+    "assistant": "this is an assistant message",
+    "custom": "this is a custom message",
+    "tool": "this is a tool message",
+}
+_TOOL_RESULT = {
+    "type": "tool-result",
+    "result": _TEXTS["tool"],
+    "tool_name": "tool_name",
+    "tool_call_id": "tool_call_id",
+}
+_TOOL_RESULT_JSON = json.dumps(_TOOL_RESULT)
+
 """
 Unit Tests
 """
 
 
 @pytest.mark.unit
-def test_user_message() -> None:
-    text = "this is a user message"
-    message = UserMessage(text)
-    content = message.content
-    assert isinstance(message, UserMessage)
-    assert len(content) == 1
-    assert isinstance(content[0], MessageTextContent)
-    assert content[0].text == text
-
-
-@pytest.mark.unit
-def test_system_message() -> None:
-    text = "this is a system message"
-    message = SystemMessage(text)
-    content = message.content
-    assert isinstance(message, SystemMessage)
-    assert len(content) == 1
-    assert content[0].text == text
-
-
-@pytest.mark.unit
-def test_assistant_message() -> None:
-    text = "this is an assistant message"
-    message = AssistantMessage(text)
+@pytest.mark.parametrize(
+    "cls,kwargs,role,content_cls",
+    [
+        (UserMessage, {"content": _TEXTS["user"]}, "user", MessageTextContent),
+        (SystemMessage, {"content": _TEXTS["system"]}, "system", MessageTextContent),
+        (AssistantMessage, {"content": _TEXTS["assistant"]}, "assistant", MessageTextContent),
+        (CustomMessage, {"content": _TEXTS["custom"], "role": "custom"}, "custom", CustomMessageContent),
+    ],
+)
+def test_message(cls: type[AnyMessage], kwargs: dict[str, Any], role: str, content_cls: type[BaseModel]) -> None:
+    message = cls(**kwargs)
     content = message.content
-    assert isinstance(message, AssistantMessage)
+    assert isinstance(message, cls)
+    assert message.role == role
     assert len(content) == 1
-    assert isinstance(content[0], MessageTextContent)
-    assert content[0].text == text
+    assert isinstance(content[0], content_cls)
+    assert content[0].model_dump()["text"] == kwargs["content"]
 
 
 @pytest.mark.unit
 def test_tool_message() -> None:
-    tool_result = {
-        "type": "tool-result",
-        "result": "this is a tool message",
-        "tool_name": "tool_name",
-        "tool_call_id": "tool_call_id",
-    }
-    message = ToolMessage(json.dumps(tool_result))
+    message = ToolMessage(_TOOL_RESULT_JSON)
     content = message.content
     assert len(content) == 1
     assert isinstance(message, ToolMessage)
-    assert content[0].model_dump() == tool_result
-
-
-@pytest.mark.unit
-def test_custom_message() -> None:
-    text = "this is a custom message"
-    message = CustomMessage(content=text, role="custom")
-    content = message.content
-    assert isinstance(message, CustomMessage)
-    assert len(content) == 1
-    assert content[0].model_dump()["text"] == text
-    assert message.role == "custom"
+    assert content[0].model_dump() == _TOOL_RESULT
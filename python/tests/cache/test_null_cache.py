@@ -12,71 +12,35 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+from typing import Any
 
 import pytest
-import pytest_asyncio
 
 from beeai_framework.cache import NullCache
 
 
-@pytest_asyncio.fixture
-async def cache() -> NullCache[str]:
-    _cache: NullCache[str] = NullCache()
-    await _cache.set("key1", "value1")
-    await _cache.set("key2", "value2")
-    await _cache.set("key3", "value3")
-    return _cache
+@pytest.fixture(scope="module")
+def cache() -> NullCache[str]:
+    return NullCache()
 
 
-@pytest.mark.asyncio
+@pytest.mark.asyncio(loop_scope="module")
 @pytest.mark.unit
-async def test_cache_size(cache: NullCache[str]) -> None:
+@pytest.mark.parametrize(
+    "method,args,expected",
+    [
+        ("size", (), 0),
+        ("set", ("key4", "value4"), None),
+        ("get", ("key0",), None),
+        ("get", ("key2",), None),
+        ("has", ("key1",), False),
+        ("has", ("key4",), False),
+        ("delete", ("key0",), True),
+        ("delete", ("key2",), True),
+        ("clear", (), None),
+    ],
+)
+async def test_cache_operations(cache: NullCache[str], method: str, args: tuple[str, ...], expected: Any) -> None:
     assert cache.enabled is False
-    assert await cache.size() == 0
-
-
-@pytest.mark.asyncio
-@pytest.mark.unit
-async def test_cache_set(cache: NullCache[str]) -> None:
-    await cache.set("key4", "value4")
-    await cache.set("key5", "value5")
-
-    assert await cache.size() == 0
-
-
-@pytest.mark.asyncio
-@pytest.mark.unit
-async def test_cache_get(cache: NullCache[str]) -> None:
-    value0 = await cache.get("key0")
-    value2 = await cache.get("key2")
-
-    assert value0 is None
-    assert value2 is None
-
-    assert await cache.size() == 0
-
-
-@pytest.mark.asyncio
-@pytest.mark.unit
-async def test_cache_has(cache: NullCache[str]) -> None:
-    assert await cache.has("key1") is False
-    assert await cache.has("key4") is False
-
-
-@pytest.mark.asyncio
-@pytest.mark.unit
-async def test_cache_delete(cache: NullCache[str]) -> None:
-    del0 = await cache.delete("key0")
-    del2 = await cache.delete("key2")
-
-    assert del0 is True
-    assert del2 is True
-    assert await cache.size() == 0
-
-
-@pytest.mark.asyncio
-@pytest.mark.unit
-async def test_cache_clear(cache: NullCache[str]) -> None:
-    assert await cache.size() == 0
-    await cache.clear()
+    assert await getattr(cache, method)(*args) == expected
     assert await cache.size() == 0
@@ -12,30 +12,41 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-
-import asyncio
-
 import pytest
 import pytest_asyncio
 
 from beeai_framework.cache import SlidingCache
 
 
-@pytest_asyncio.fixture
-async def sized_cache() -> SlidingCache[str]:
+@pytest_asyncio.fixture(scope="module", loop_scope="module")
+async def seeded_sized_cache() -> SlidingCache[str]:
     _cache: SlidingCache[str] = SlidingCache(size=4)
-    await _cache.set("key1", "value1")
-    await _cache.set("key2", "value2")
-    await _cache.set("key3", "value3")
+    await _cache.set_many({"key1": "value1", "key2": "value2", "key3": "value3"})
     return _cache
 
 
 @pytest_asyncio.fixture
-async def timed_cache() -> SlidingCache[str]:
-    _cache: SlidingCache[str] = SlidingCache(size=4, ttl=3)
-    await _cache.set("key1", "value1")
-    await _cache.set("key2", "value2")
-    await _cache.set("key3", "value3")
+async def sized_cache(seeded_sized_cache: SlidingCache[str]) -> SlidingCache[str]:
+    return await seeded_sized_cache.clone()
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.time = 0.0
+
+    def __call__(self) -> float:
+        return self.time
+
+
+@pytest.fixture
+def clock() -> FakeClock:
+    return FakeClock()
+
+
+@pytest_asyncio.fixture
+async def timed_cache(clock: FakeClock) -> SlidingCache[str]:
+    _cache: SlidingCache[str] = SlidingCache(size=4, ttl=3, now=clock)
+    await _cache.set_many({"key1": "value1", "key2": "value2", "key3": "value3"})
     return _cache
 
 
@@ -87,6 +98,19 @@ async def test_cache_delete(sized_cache: SlidingCache[str]) -> None:
     assert await sized_cache.size() == 4
 
 
+@pytest.mark.asyncio
+@pytest.mark.unit
+async def test_cache_eviction_order(sized_cache: SlidingCache[str]) -> None:
+    assert await sized_cache.get("key1") == "value1"
+
+    await sized_cache.set("key4", "value4")
+    await sized_cache.set("key5", "value5")
+
+    assert await sized_cache.has("key1")
+    assert await sized_cache.has("key2") is False
+    assert await sized_cache.size() == 4
+
+
 @pytest.mark.asyncio
 @pytest.mark.unit
 async def test_cache_clear(sized_cache: SlidingCache[str]) -> None:
@@ -97,7 +121,45 @@ async def test_cache_clear(sized_cache: SlidingCache[str]) -> None:
 
 @pytest.mark.asyncio
 @pytest.mark.unit
-async def test_cache_timed(timed_cache: SlidingCache[str]) -> None:
+async def test_cache_timed(timed_cache: SlidingCache[str], clock: FakeClock) -> None:
+    assert await timed_cache.size() == 3
+    clock.time += 2.9
     assert await timed_cache.size() == 3
-    await asyncio.sleep(3)
+    clock.time += 0.1
+    assert await timed_cache.has("key1") is False
+    assert await timed_cache.get("key2") is None
+    assert await timed_cache.delete("key3") is False
     assert await timed_cache.size() == 0
+
+
+@pytest.mark.asyncio
+@pytest.mark.unit
+async def test_cache_timed_evicts_expired_first(clock: FakeClock) -> None:
+    cache: SlidingCache[str] = SlidingCache(size=2, ttl=10, now=clock)
+    await cache.set("a", "value_a")
+    clock.time = 1
+    await cache.set("b", "value_b")
+    clock.time = 2
+    assert await cache.get("a") == "value_a"
+
+    clock.time = 10.5
+    await cache.set("c", "value_c")
+
+    assert await cache.has("a") is False
+    assert await cache.get("b") == "value_b"
+    assert await cache.get("c") == "value_c"
+    assert await cache.size() == 2
+
+
+@pytest.mark.asyncio
+@pytest.mark.unit
+async def test_cache_timed_many_entries(clock: FakeClock) -> None:
+    cache: SlidingCache[int] = SlidingCache(size=10_000, ttl=3, now=clock)
+    for i in range(10_000):
+        await cache.set(f"key{i}", i)
+
+    assert await cache.size() == 10_000
+    assert await cache.get("key0") == 0
+
+    clock.time += 3
+    assert await cache.size() == 0
@@ -19,15 +19,18 @@ import pytest_asyncio
 from beeai_framework.cache import UnconstrainedCache
 
 
-@pytest_asyncio.fixture
-async def cache() -> UnconstrainedCache[str]:
+@pytest_asyncio.fixture(scope="module", loop_scope="module")
+async def seeded_cache() -> UnconstrainedCache[str]:
     _cache: UnconstrainedCache[str] = UnconstrainedCache()
-    await _cache.set("key1", "value1")
-    await _cache.set("key2", "value2")
-    await _cache.set("key3", "value3")
+    await _cache.set_many({"key1": "value1", "key2": "value2", "key3": "value3"})
     return _cache
 
 
+@pytest_asyncio.fixture
+async def cache(seeded_cache: UnconstrainedCache[str]) -> UnconstrainedCache[str]:
+    return await seeded_cache.clone()
+
+
 @pytest.mark.asyncio
 @pytest.mark.unit
 async def test_cache_size(cache: UnconstrainedCache[str]) -> None:
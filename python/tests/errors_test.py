@@ -88,18 +88,15 @@ class TestFrameworkError:
         inner_err = ValueError("Inner")
         err = FrameworkError("Outer", cause=inner_err)
 
-        errors: list[BaseException] = list(err.traverse())
-        assert len(errors) == 1
-        assert errors[0] == err
+        # zip(strict=True) checks both the order and the number of traversed errors
+        for error, expected in zip(err.traverse(), [err], strict=True):
+            assert error is expected
 
         inner_err2 = FrameworkError("inner2")
         inner_err1 = FrameworkError("inner", cause=inner_err2)
         err = FrameworkError("outer", cause=inner_err1)
-        errors = list(err.traverse())
-        assert len(errors) == 3
-        assert errors[0] == err
-        assert errors[1] == inner_err1
-        assert errors[2] == inner_err2
+        for error, expected in zip(err.traverse(), [err, inner_err1, inner_err2], strict=True):
+            assert error is expected
 
     @pytest.mark.unit
     def test_explain(self) -> None:
@@ -169,6 +166,20 @@ class TestFrameworkError:
         err6 = FrameworkError("Mixed Context", context={"a": 1, "b": my_func})
         assert 'Context: "Cannot serialize context to JSON"' in err6.explain()
 
+    @pytest.mark.unit
+    def test_context_json_refresh(self) -> None:
+        err = FrameworkError("Updated context", context={"a": 1})
+        assert 'Context: {"a": 1}' in err.explain()
+
+        err.context["b"] = 2
+        assert 'Context: {"a": 1, "b": 2}' in err.explain()
+
+        err.context = {"b": 2}
+        assert 'Context: {"b": 2}' in err.explain()
+
+        FrameworkError.ensure(err, context={"c": 3})
+        assert 'Context: {"b": 2, "c": 3}' in err.explain()
+
     def test_is_fatal(self) -> None:
         err = FrameworkError("Test", is_fatal=True)
         assert FrameworkError.is_fatal(err) is True
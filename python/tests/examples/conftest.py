@@ -0,0 +1,42 @@
+# Copyright 2025 © BeeAI a Series of LF Projects, LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import builtins
+import itertools
+from collections.abc import Callable, Generator
+
+import pytest
+from dotenv import load_dotenv
+
+EXAMPLE_INPUTS = ("Hello world", "q")
+
+
+def pytest_configure(config: pytest.Config) -> None:
+    # Runs once per session, before test_examples.py is imported and builds its exclude list from the environment
+    load_dotenv()
+
+
+@pytest.fixture(scope="session")
+def rewind_input() -> Generator[Callable[[], None], None, None]:
+    """Replace builtins.input for the whole session and yield a function that rewinds the scripted answers."""
+    answers = itertools.cycle(EXAMPLE_INPUTS)
+
+    def reset() -> None:
+        nonlocal answers
+        answers = itertools.cycle(EXAMPLE_INPUTS)
+
+    original = builtins.input
+    builtins.input = lambda *_: next(answers)
+    yield reset
+    builtins.input = original
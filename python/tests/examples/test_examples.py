@@ -13,66 +13,85 @@
 # limitations under the License.
 
 import os
-import pathlib
-import runpy
+import sys
+import types
+from collections.abc import Callable, Generator
 
 import pytest
-from dotenv import load_dotenv
-
-load_dotenv()
-
-all_examples = list(pathlib.Path(__file__, "../../../examples").resolve().rglob("*.py"))
-
-exclude = list(
-    filter(
-        None,
-        [
-            # Dont test helper code
-            "helpers/io.py",
-            # Only test authenticated providers if API key is found
-            "backend/providers/watsonx.py" if os.getenv("WATSONX_API_KEY") is None else None,
-            "backend/providers/openai_example.py" if os.getenv("OPENAI_API_KEY") is None else None,
-            "backend/providers/groq.py" if os.getenv("GROQ_API_KEY") is None else None,
-            "backend/providers/xai.py" if os.getenv("XAI_API_KEY") is None else None,
-            # Google backend picks up environment variables/google auth credentials directly
-            "backend/providers/vertexai.py" if os.getenv("GOOGLE_VERTEX_PROJECT") is None else None,
-            "backend/providers/amazon_bedrock.py" if os.getenv("AWS_ACCESS_KEY_ID") is None else None,
-            "backend/providers/anthropic.py" if os.getenv("ANTHROPIC_API_KEY") is None else None,
-            "backend/providers/azure_openai.py" if os.getenv("AZURE_API_KEY") is None else None,
-            # MCP examples require Slack bot
-            "tools/mcp_agent.py" if os.getenv("SLACK_BOT_TOKEN") is None else None,
-            "tools/mcp_tool_creation.py" if os.getenv("SLACK_BOT_TOKEN") is None else None,
-            "tools/mcp_slack_agent.py" if os.getenv("SLACK_BOT_TOKEN") is None else None,
-            # Example requires Searx instance
-            "workflows/searx_agent.py",
-            # Requires BeeAI platform to be running
-            "agents/experimental/remote.py",
-            "workflows/remote.py",
-            # Requires Code Interpreter to be running
-            "tools/python_tool.py" if os.getenv("CODE_INTERPRETER_URL") is None else None,
-            "tools/custom/sandbox.py" if os.getenv("CODE_INTERPRETER_URL") is None else None,
-            # Requires custom prompt
-            "workflows/travel_advisor.py",
-        ],
-    )
+
+pytestmark = pytest.mark.e2e
+
+
+def walk_examples(root: str) -> Generator[str, None, None]:
+    with os.scandir(root) as entries:
+        for entry in entries:
+            if entry.is_dir(follow_symlinks=False):
+                yield from walk_examples(entry.path)
+            elif entry.name.endswith(".py"):
+                yield entry.path
+
+
+examples_root = os.path.realpath(os.path.join(os.path.dirname(__file__), "..", "..", "examples"))
+
+# Examples that are never run
+skipped_examples = (
+    # Dont test helper code
+    "helpers/io.py",
+    # Example requires Searx instance
+    "workflows/searx_agent.py",
+    # Requires BeeAI platform to be running
+    "agents/experimental/remote.py",
+    "workflows/remote.py",
+    # Requires custom prompt
+    "workflows/travel_advisor.py",
 )
 
+# Examples that only run when the given environment variable is set
+gated_examples = (
+    # Only test authenticated providers if API key is found
+    ("backend/providers/watsonx.py", "WATSONX_API_KEY"),
+    ("backend/providers/openai_example.py", "OPENAI_API_KEY"),
+    ("backend/providers/groq.py", "GROQ_API_KEY"),
+    ("backend/providers/xai.py", "XAI_API_KEY"),
+    # Google backend picks up environment variables/google auth credentials directly
+    ("backend/providers/vertexai.py", "GOOGLE_VERTEX_PROJECT"),
+    ("backend/providers/amazon_bedrock.py", "AWS_ACCESS_KEY_ID"),
+    ("backend/providers/anthropic.py", "ANTHROPIC_API_KEY"),
+    ("backend/providers/azure_openai.py", "AZURE_API_KEY"),
+    # MCP examples require Slack bot
+    ("tools/mcp_agent.py", "SLACK_BOT_TOKEN"),
+    ("tools/mcp_tool_creation.py", "SLACK_BOT_TOKEN"),
+    ("tools/mcp_slack_agent.py", "SLACK_BOT_TOKEN"),
+    # Requires Code Interpreter to be running
+    ("tools/python_tool.py", "CODE_INTERPRETER_URL"),
+    ("tools/custom/sandbox.py", "CODE_INTERPRETER_URL"),
+)
 
-def example_name(path: pathlib.Path) -> str:
-    return os.path.relpath(path, start="examples")
+exclude = frozenset(skipped_examples).union(path for path, env in gated_examples if env not in os.environ)
 
 
-examples = sorted({example for example in all_examples if example_name(example) not in exclude}, key=example_name)
+# Resolve each example's name once and reuse it both for filtering and as the test id
+named_examples = sorted(
+    (name, path)
+    for path in walk_examples(examples_root)
+    if (name := os.path.relpath(path, start=examples_root)) not in exclude
+)
+examples = [path for _, path in named_examples]
+example_ids = [name for name, _ in named_examples]
 
 
-@pytest.mark.e2e
 def test_finds_examples() -> None:
     assert examples
 
 
-@pytest.mark.e2e
-@pytest.mark.parametrize("example", examples, ids=example_name)
-def test_example_execution(example: str, monkeypatch: pytest.MonkeyPatch) -> None:
-    inputs = iter(["Hello world", "q"])
-    monkeypatch.setattr("builtins.input", lambda _: next(inputs))
-    runpy.run_path(example, run_name="__main__")
+@pytest.mark.parametrize("example", examples, ids=example_ids)
+def test_example_execution(example: str, rewind_input: Callable[[], None], monkeypatch: pytest.MonkeyPatch) -> None:
+    rewind_input()
+    # Mirror runpy.run_path: run the example in a fresh __main__ module
+    module = types.ModuleType("__main__")
+    module.__file__ = example
+    monkeypatch.setitem(sys.modules, "__main__", module)
+    monkeypatch.setattr(sys, "argv", [example])
+    with open(example, "rb") as f:
+        code = compile(f.read(), example, "exec")
+    exec(code, module.__dict__)
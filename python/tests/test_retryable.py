@@ -16,7 +16,7 @@
 import pytest
 
 from beeai_framework.errors import FrameworkError
-from beeai_framework.retryable import Retryable, RetryableConfig, RetryableContext
+from beeai_framework.retryable import Retryable, RetryableConfig, RetryableContext, RetryableInput
 
 """
 Utility functions and classes
@@ -39,26 +39,28 @@ async def on_retry(ctx: RetryableContext, last_error: Exception) -> None:
     print(f"on_retry: {ctx}")
 
 
+# Validated once; tests derive their variants with model_copy(update=...), which skips re-validation
+retryable_input: RetryableInput[None] = RetryableInput(
+    executor=executor,
+    on_reset=on_reset,
+    on_error=on_error,
+    on_retry=on_retry,
+    config=RetryableConfig(max_retries=3),
+)
+
+
 """
 Unit Tests
 """
 
 
-@pytest.mark.asyncio
+@pytest.mark.asyncio(loop_scope="module")
 @pytest.mark.unit
 async def test_retryable() -> None:
-    await Retryable(
-        {
-            "executor": executor,
-            "on_reset": on_reset,
-            "on_error": on_error,
-            "on_retry": on_retry,
-            "config": RetryableConfig(max_retries=3),
-        }
-    ).get()
-
-
-@pytest.mark.asyncio
+    await Retryable(retryable_input).get()
+
+
+@pytest.mark.asyncio(loop_scope="module")
 @pytest.mark.unit
 async def test_retryable_retries() -> None:
     async def executor(ctx: RetryableContext) -> None:
@@ -69,11 +71,7 @@ async def test_retryable_retries() -> None:
 
     with pytest.raises(FrameworkError, match=f"frameworkerror:test_retryable_retries:{max_retries + 1}"):
         await Retryable(
-            {
-                "executor": executor,
-                "on_reset": on_reset,
-                "on_error": on_error,
-                "on_retry": on_retry,
-                "config": RetryableConfig(max_retries=max_retries),
-            }
+            retryable_input.model_copy(
+                update={"executor": executor, "config": RetryableConfig(max_retries=max_retries)}
+            )
         ).get()
@@ -13,66 +13,70 @@
 # limitations under the License.
 
 
+from typing import Any
+
 import pytest
 
-from beeai_framework.tools import StringToolOutput, tool
+from beeai_framework.tools import AnyTool, StringToolOutput, tool
 
 """
-Unit Tests
+Utility functions and classes
 """
 
 
-@pytest.mark.unit
-@pytest.mark.asyncio
-async def test_tool_annotation() -> None:
-    @tool
-    def test_tool(query: str) -> str:
-        """
-        Search factual and historical information, including biography, history, politics, geography, society, culture,
-        science, technology, people, animal species, mathematics, and other subjects.
+@tool
+def query_tool(query: str) -> str:
+    """
+    Search factual and historical information, including biography, history, politics, geography, society, culture,
+    science, technology, people, animal species, mathematics, and other subjects.
 
-        Args:
-            query: The topic or question to search for on Wikipedia.
+    Args:
+        query: The topic or question to search for on Wikipedia.
 
-        Returns:
-            The information found via searching Wikipedia.
-        """
-        return query
+    Returns:
+        The information found via searching Wikipedia.
+    """
+    return query
 
-    query = "Hello!"
-    result: StringToolOutput = await test_tool.run({"query": query})
-    assert result.get_text_content() == query
 
+@tool
+def no_params_tool() -> str:
+    """
+    Search factual and historical information, including biography, history, politics, geography, society, culture,
+    science, technology, people, animal species, mathematics, and other subjects.
+    """
+    return "Hello!"
 
-@pytest.mark.unit
-@pytest.mark.asyncio
-async def test_tool_annotation_no_params() -> None:
-    @tool
-    def test_tool() -> str:
-        """
-        Search factual and historical information, including biography, history, politics, geography, society, culture,
-        science, technology, people, animal species, mathematics, and other subjects.
-        """
-        return "Hello!"
 
-    result: StringToolOutput = await test_tool.run({})
-    assert result.get_text_content() == "Hello!"
+@tool
+def empty_desc_tool() -> str:
+    """"""
+    return "Hello!"
 
 
-@pytest.mark.unit
-@pytest.mark.asyncio
-async def test_tool_annotation_empty_desc() -> None:
-    @tool
-    def test_tool() -> str:
-        """"""
-        return "Hello!"
+"""
+Unit Tests
+"""
 
-    result: StringToolOutput = await test_tool.run({})
-    assert result.get_text_content() == "Hello!"
+
+@pytest.mark.unit
+@pytest.mark.asyncio(loop_scope="module")
+@pytest.mark.parametrize(
+    "annotated_tool, input, expected",
+    [
+        (query_tool, {"query": "Hello!"}, "Hello!"),
+        (no_params_tool, {}, "Hello!"),
+        (empty_desc_tool, {}, "Hello!"),
+    ],
+    ids=["params", "no_params", "empty_desc"],
+)
+async def test_tool_annotation(annotated_tool: AnyTool, input: dict[str, Any], expected: str) -> None:
+    result: StringToolOutput = await annotated_tool.run(input)
+    assert result.get_text_content() == expected
 
 
 @pytest.mark.unit
-@pytest.mark.asyncio
+@pytest.mark.asyncio(loop_scope="module")
 async def test_tool_annotation_no_desc() -> None:
     with pytest.raises(ValueError):  # No description provided
 
@@ -29,7 +29,7 @@ Utility functions and classes
 """
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def tool() -> DuckDuckGoSearchTool:
     return DuckDuckGoSearchTool()
 
@@ -40,7 +40,7 @@ Unit Tests
 
 
 @pytest.mark.unit
-@pytest.mark.asyncio
+@pytest.mark.asyncio(loop_scope="module")
 async def test_call_invalid_input_type(tool: DuckDuckGoSearchTool) -> None:
     with pytest.raises(ToolInputValidationError):
         await tool.run(input={"search": "Poland"})
@@ -52,7 +52,7 @@ E2E Tests
 
 
 @pytest.mark.e2e
-@pytest.mark.asyncio
+@pytest.mark.asyncio(loop_scope="module")
 async def test_output(tool: DuckDuckGoSearchTool) -> None:
     result = await tool.run(
         input=DuckDuckGoSearchToolInput(query="What is the highest mountain of the Czech Republic?")
@@ -27,7 +27,7 @@ Unit Tests
 
 
 @pytest.mark.unit
-@pytest.mark.asyncio
+@pytest.mark.asyncio(loop_scope="module")
 async def test_tool_emitter() -> None:
     async def process_agent_events(event_data: Any, event_meta: EventMeta) -> None:
         print(
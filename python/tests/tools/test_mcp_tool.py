@@ -13,8 +13,6 @@
 # limitations under the License.
 
 
-from collections.abc import Callable
-from typing import Any
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
@@ -43,21 +41,25 @@ def mock_server_params() -> AsyncMock:
     return AsyncMock(spec=StdioServerParameters)
 
 
+TWO_NUMBERS_SCHEMA = {
+    "type": "object",
+    "properties": {"a": {"type": "number"}, "b": {"type": "number"}},
+    "required": ["a", "b"],
+}
+
+
+# Tool info and results are read-only, so they are built once per module
 # Basic Tool Test Fixtures
-@pytest.fixture
+@pytest.fixture(scope="module")
 def mock_tool_info() -> MCPToolInfo:
     return MCPToolInfo(
         name="test_tool",
         description="A test tool",
-        inputSchema={
-            "type": "object",
-            "properties": {"a": {"type": "number"}, "b": {"type": "number"}},
-            "required": ["a", "b"],
-        },
+        inputSchema=TWO_NUMBERS_SCHEMA,
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def call_tool_result() -> CallToolResult:
     return CallToolResult(  # type: ignore
         output="test_output",
@@ -65,21 +67,22 @@ def call_tool_result() -> CallToolResult:
     )
 
 
+@pytest.fixture(scope="module")
+def call_tool_result_str(call_tool_result: CallToolResult) -> str:
+    return str(call_tool_result)
+
+
 # Calculator Tool Test Fixtures
-@pytest.fixture
+@pytest.fixture(scope="module")
 def add_numbers_tool_info() -> MCPToolInfo:
     return MCPToolInfo(
         name="add_numbers",
         description="Adds two numbers together",
-        inputSchema={
-            "type": "object",
-            "properties": {"a": {"type": "number"}, "b": {"type": "number"}},
-            "required": ["a", "b"],
-        },
+        inputSchema=TWO_NUMBERS_SCHEMA,
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def add_result() -> CallToolResult:
     return CallToolResult(  # type: ignore
         output="8",
@@ -87,9 +90,14 @@ def add_result() -> CallToolResult:
     )
 
 
+@pytest.fixture(scope="module")
+def add_result_str(add_result: CallToolResult) -> str:
+    return str(add_result)
+
+
 # Basic Tool Tests
 class TestMCPTool:
-    @pytest.mark.asyncio
+    @pytest.mark.asyncio(loop_scope="module")
     @pytest.mark.unit
     async def test_mcp_tool_initialization(
         self, mock_client_session: ClientSession, mock_tool_info: MCPToolInfo
@@ -99,7 +107,7 @@ class TestMCPTool:
         assert tool.name == "test_tool"
         assert tool.description == "A test tool"
 
-    @pytest.mark.asyncio
+    @pytest.mark.asyncio(loop_scope="module")
     @pytest.mark.unit
     @patch.object(MCPTool, "_run")
     async def test_mcp_tool_run(  # type: ignore
@@ -107,18 +115,18 @@ class TestMCPTool:
         mock__run,  # noqa: ANN001
         mock_client_session: ClientSession,
         mock_tool_info: MCPToolInfo,
-        call_tool_result: str,
+        call_tool_result_str: str,
     ) -> None:
-        mock__run.return_value = StringToolOutput(str(call_tool_result))
+        mock__run.return_value = StringToolOutput(call_tool_result_str)
         tool = MCPTool(session=mock_client_session, tool=mock_tool_info)
         input_data = {"a": 1, "b": 2}
 
         result = await tool.run(input_data)
 
         assert isinstance(result, StringToolOutput)
-        assert result.result == str(call_tool_result)
+        assert result.result == call_tool_result_str
 
-    @pytest.mark.asyncio
+    @pytest.mark.asyncio(loop_scope="module")
     @pytest.mark.unit
     async def test_mcp_tool_from_client(self, mock_client_session: ClientSession, mock_tool_info: MCPToolInfo) -> None:
         tools_result = MagicMock()
@@ -135,7 +143,7 @@ class TestMCPTool:
 
 # Calculator Tool Tests
 class TestAddNumbersTool:
-    @pytest.mark.asyncio
+    @pytest.mark.asyncio(loop_scope="module")
     @pytest.mark.unit
     @patch.object(MCPTool, "_run")
     async def test_add_numbers_mcp(  # type: ignore
@@ -143,9 +151,9 @@ class TestAddNumbersTool:
         mock__run,  # noqa: ANN001
         mock_client_session: ClientSession,
         add_numbers_tool_info: MCPToolInfo,
-        add_result: Callable[..., Any],
+        add_result_str: str,
     ) -> None:
-        mock__run.return_value = StringToolOutput(str(add_result))
+        mock__run.return_value = StringToolOutput(add_result_str)
         tool = MCPTool(session=mock_client_session, tool=add_numbers_tool_info)
         input_data = {"a": 5, "b": 3}
 
@@ -153,7 +161,7 @@ class TestAddNumbersTool:
 
         assert isinstance(result, StringToolOutput)
 
-    @pytest.mark.asyncio
+    @pytest.mark.asyncio(loop_scope="module")
     @pytest.mark.unit
     async def test_add_numbers_from_client(
         self,
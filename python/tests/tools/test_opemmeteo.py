@@ -17,12 +17,14 @@ import pytest
 from beeai_framework.tools import StringToolOutput, ToolInputValidationError
 from beeai_framework.tools.weather import OpenMeteoTool, OpenMeteoToolInput
 
+pytestmark = [pytest.mark.e2e, pytest.mark.asyncio(loop_scope="module")]
+
 """
 Utility functions and classes
 """
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def tool() -> OpenMeteoTool:
     return OpenMeteoTool()
 
@@ -32,8 +34,6 @@ E2E Tests
 """
 
 
-@pytest.mark.e2e
-@pytest.mark.asyncio
 async def test_call_model(tool: OpenMeteoTool) -> None:
     await tool.run(
         input=OpenMeteoToolInput(
@@ -44,28 +44,20 @@ async def test_call_model(tool: OpenMeteoTool) -> None:
     )
 
 
-@pytest.mark.e2e
-@pytest.mark.asyncio
 async def test_call_dict(tool: OpenMeteoTool) -> None:
     await tool.run(input={"location_name": "White Plains"})
 
 
-@pytest.mark.e2e
-@pytest.mark.asyncio
 async def test_call_invalid_missing_field(tool: OpenMeteoTool) -> None:
     with pytest.raises(ToolInputValidationError):
         await tool.run(input={})
 
 
-@pytest.mark.e2e
-@pytest.mark.asyncio
 async def test_call_invalid_bad_type(tool: OpenMeteoTool) -> None:
     with pytest.raises(ToolInputValidationError):
         await tool.run(input={"location_name": 1})
 
 
-@pytest.mark.e2e
-@pytest.mark.asyncio
 async def test_output(tool: OpenMeteoTool) -> None:
     result = await tool.run(input={"location_name": "White Plains"})
     assert type(result) is StringToolOutput
@@ -23,8 +23,11 @@ import pytest_asyncio
 
 from beeai_framework.tools.code import LocalPythonStorage, PythonTool
 
+pytestmark = [pytest.mark.e2e, pytest.mark.asyncio(loop_scope="module")]
 
-@pytest_asyncio.fixture
+
+# Built once per module; with the interpreter stubbed, tests only copy file1.txt in and out of storage
+@pytest_asyncio.fixture(scope="module")
 def test_dirs() -> Generator[tuple[str, str], Any, None]:
     local_dir = "local_dir"
     interpreter_dir = "interpreter_dir"
@@ -46,7 +49,7 @@ def test_dirs() -> Generator[tuple[str, str], Any, None]:
     shutil.rmtree(interpreter_dir)
 
 
-@pytest_asyncio.fixture
+@pytest_asyncio.fixture(scope="module", loop_scope="module")
 async def tool(test_dirs: tuple[str, str]) -> PythonTool:
     tool = PythonTool(
         code_interpreter_url="dummyURL",
@@ -55,11 +58,10 @@ async def tool(test_dirs: tuple[str, str]) -> PythonTool:
     return tool
 
 
-@pytest.mark.e2e
-@pytest.mark.asyncio
 async def test_without_file(tool: PythonTool) -> None:
-    with patch(
-        "beeai_framework.tools.code.PythonTool.call_code_interpreter",
+    with patch.object(
+        PythonTool,
+        "call_code_interpreter",
         return_value={"stdout": "2\n", "stderr": "", "exit_code": 0, "files": {}},
     ):
         result = await tool.run(
@@ -73,17 +75,25 @@ async def test_without_file(tool: PythonTool) -> None:
     assert "2" in result.stdout
 
 
-@pytest.mark.e2e
-@pytest.mark.asyncio
 async def test_with_file(tool: PythonTool) -> None:
-    with patch(
-        "beeai_framework.tools.code.PythonTool.call_code_interpreter",
-        return_value={
-            "stdout": "",
-            "stderr": "",
-            "exit_code": 0,
-            "files": {"/workspace/file1.txt": "dummyID"},
-        },
+    # One patch serves both runs; each call consumes the next interpreter response
+    with patch.object(
+        PythonTool,
+        "call_code_interpreter",
+        side_effect=[
+            {
+                "stdout": "",
+                "stderr": "",
+                "exit_code": 0,
+                "files": {"/workspace/file1.txt": "dummyID"},
+            },
+            {
+                "stdout": "4\n",
+                "stderr": "",
+                "exit_code": 0,
+                "files": {"/workspace/file1.txt": "dummyID"},
+            },
+        ],
     ):
         first_result = await tool.run(
             {
@@ -96,18 +106,9 @@ with open('file1.txt', 'w') as f:
             }
         )
 
-    assert len(first_result.output_files) == 1
-    assert first_result.output_files[0].filename == "file1.txt"
-
-    with patch(
-        "beeai_framework.tools.code.PythonTool.call_code_interpreter",
-        return_value={
-            "stdout": "4\n",
-            "stderr": "",
-            "exit_code": 0,
-            "files": {"/workspace/file1.txt": "dummyID"},
-        },
-    ):
+        assert len(first_result.output_files) == 1
+        assert first_result.output_files[0].filename == "file1.txt"
+
         result = await tool.run(
             {
                 "language": "python",
@@ -12,119 +12,103 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+
 import json
-from unittest.mock import patch
+from contextlib import AbstractContextManager, nullcontext
+from typing import Any
+from unittest.mock import AsyncMock
 
+import httpx
 import pytest
+import pytest_asyncio
 
 from beeai_framework.tools import StringToolOutput, ToolError
-from beeai_framework.tools.code import SandboxTool
+from beeai_framework.tools.code import PythonTool, SandboxTool
 from beeai_framework.tools.code.sandbox import SandboxToolCreateError, SandboxToolExecuteError
 
+"""
+Utility functions and classes
+"""
 
-@pytest.mark.unit
-@pytest.mark.asyncio
-async def test_instantiate() -> None:
-    with patch(
-        "beeai_framework.tools.code.PythonTool.call_code_interpreter",
-        return_value={
-            "tool_name": "test",
-            "tool_description": "A test tool",
-            "tool_input_schema_json": json.dumps(
-                {
-                    "type": "object",
-                    "properties": {
-                        "a": {"type": "integer"},
-                        "b": {"type": "string"},
-                    },
-                }
-            ),
-        },
-    ):
-        sandbox_tool = await SandboxTool.from_source_code(url="dummyURL", source_code="source code")
+INPUT_SCHEMA = {
+    "type": "object",
+    "properties": {"a": {"type": "integer"}, "b": {"type": "string"}},
+}
+
+# Interpreter response describing the parsed tool; the schema is serialized once at import
+TOOL_DEFINITION = {
+    "tool_name": "test",
+    "tool_description": "A test tool",
+    "tool_input_schema_json": json.dumps(INPUT_SCHEMA),
+}
+
+
+@pytest.fixture
+def call_code_interpreter(monkeypatch: pytest.MonkeyPatch) -> AsyncMock:
+    # Patched once per test; tests swap the interpreter response through return_value
+    mock = AsyncMock()
+    monkeypatch.setattr(PythonTool, "call_code_interpreter", mock)
+    return mock
+
+
+@pytest_asyncio.fixture(scope="module", loop_scope="module")
+async def sandbox_tool() -> SandboxTool:
+    # Created once; the tool resolves PythonTool.call_code_interpreter per run, so tests can still patch it
+    with pytest.MonkeyPatch.context() as monkeypatch:
+        monkeypatch.setattr(PythonTool, "call_code_interpreter", AsyncMock(return_value=TOOL_DEFINITION))
+        return await SandboxTool.from_source_code(url="dummyURL", source_code="source code")
 
+
+"""
+Unit Tests
+"""
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio(loop_scope="module")
+async def test_instantiate(sandbox_tool: SandboxTool) -> None:
     assert sandbox_tool.name == "test"
     assert sandbox_tool.description == "A test tool"
-    assert sandbox_tool.input_schema.model_json_schema() == {
-        "type": "object",
-        "properties": {"a": {"type": "integer"}, "b": {"type": "string"}},
-    }
+    assert sandbox_tool.input_schema.model_json_schema() == INPUT_SCHEMA
 
 
 @pytest.mark.unit
-@pytest.mark.asyncio
-async def test_create_error() -> None:
-    with (
-        patch(
-            "beeai_framework.tools.code.PythonTool.call_code_interpreter",
-            return_value={"cause": {"name": "HTTPParserError"}},
-        ),
-        pytest.raises(SandboxToolCreateError),
-    ):
+@pytest.mark.asyncio(loop_scope="module")
+async def test_create_error(call_code_interpreter: AsyncMock) -> None:
+    call_code_interpreter.return_value = {"cause": {"name": "HTTPParserError"}}
+    with pytest.raises(SandboxToolCreateError):
         await SandboxTool.from_source_code(url="dummyURL", source_code="source code")
 
 
 @pytest.mark.unit
-@pytest.mark.asyncio
-async def test_run() -> None:
-    with patch(
-        "beeai_framework.tools.code.PythonTool.call_code_interpreter",
-        return_value={
-            "tool_name": "test",
-            "tool_description": "A test tool",
-            "tool_input_schema_json": json.dumps(
-                {
-                    "type": "object",
-                    "properties": {"a": {"type": "integer"}, "b": {"type": "string"}},
-                }
-            ),
-        },
-    ):
-        sandbox_tool = await SandboxTool.from_source_code(url="dummyURL", source_code="source code")
-
-    with patch(
-        "beeai_framework.tools.code.PythonTool.call_code_interpreter",
-        return_value={"exit_code": 0, "tool_output_json": '{"something": "42"}'},
-    ):
+@pytest.mark.asyncio(loop_scope="module")
+@pytest.mark.parametrize(
+    "response, expectation, output",
+    [
+        ({"exit_code": 0, "tool_output_json": '{"something": "42"}'}, nullcontext(), '{"something": "42"}'),
+        ({"stderr": "Oh no, it does not work"}, pytest.raises(SandboxToolExecuteError), None),
+    ],
+    ids=["success", "execute_error"],
+)
+async def test_run(
+    sandbox_tool: SandboxTool,
+    call_code_interpreter: AsyncMock,
+    response: dict[str, Any],
+    expectation: AbstractContextManager[Any],
+    output: str | None,
+) -> None:
+    call_code_interpreter.return_value = response
+    with expectation:
         result = await sandbox_tool.run({"a": 42, "b": "test"})
 
-    assert isinstance(result, StringToolOutput)
-    assert result.get_text_content() == '{"something": "42"}'
-
-
-@pytest.mark.unit
-@pytest.mark.asyncio
-async def test_execute_error() -> None:
-    with patch(
-        "beeai_framework.tools.code.PythonTool.call_code_interpreter",
-        return_value={
-            "tool_name": "test",
-            "tool_description": "A test tool",
-            "tool_input_schema_json": json.dumps(
-                {
-                    "type": "object",
-                    "properties": {
-                        "a": {"type": "integer"},
-                        "b": {"type": "string"},
-                    },
-                }
-            ),
-        },
-    ):
-        sandbox_tool = await SandboxTool.from_source_code(url="dummyURL", source_code="source code")
-
-    with (
-        patch(
-            "beeai_framework.tools.code.PythonTool.call_code_interpreter",
-            return_value={"stderr": "Oh no, it does not work"},
-        ),
-        pytest.raises(SandboxToolExecuteError),
-    ):
-        await sandbox_tool.run({"a": 42, "b": "test"})
+        assert isinstance(result, StringToolOutput)
+        assert result.get_text_content() == output
 
 
 @pytest.mark.unit
-@pytest.mark.asyncio
-async def test_http_error() -> None:
-    with pytest.raises(ToolError):
+@pytest.mark.asyncio(loop_scope="module")
+async def test_http_error(monkeypatch: pytest.MonkeyPatch) -> None:
+    # Fail at the transport so the interpreter's error translation is exercised without touching the network
+    monkeypatch.setattr(httpx.AsyncClient, "post", AsyncMock(side_effect=httpx.ConnectError("Connection refused")))
+    with pytest.raises(ToolError, match="Request to code interpreter has failed"):
         await SandboxTool.from_source_code(url="dummyURL", source_code="source code")
@@ -24,12 +24,14 @@ from beeai_framework.tools.search.wikipedia import (
     WikipediaToolOutput,
 )
 
+pytestmark = [pytest.mark.e2e, pytest.mark.asyncio(loop_scope="module")]
+
 """
 Utility functions and classes
 """
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def tool() -> WikipediaTool:
     return WikipediaTool()
 
@@ -39,39 +41,29 @@ E2E Tests
 """
 
 
-@pytest.mark.e2e
-@pytest.mark.asyncio
 async def test_call_invalid_input_type(tool: WikipediaTool) -> None:
     with pytest.raises(ToolInputValidationError):
         await tool.run(input={"search": "Bee"})
 
 
-@pytest.mark.e2e
-@pytest.mark.asyncio
 async def test_output(tool: WikipediaTool) -> None:
     result = await tool.run(input=WikipediaToolInput(query="bee"))
     assert type(result) is WikipediaToolOutput
     assert "Bees are winged insects closely related to wasps and ants" in result.get_text_content()
 
 
-@pytest.mark.e2e
-@pytest.mark.asyncio
 async def test_full_text_output(tool: WikipediaTool) -> None:
     result = await tool.run(input=WikipediaToolInput(query="bee", full_text=True))
     assert type(result) is WikipediaToolOutput
     assert "n-triscosane" in result.get_text_content()
 
 
-@pytest.mark.e2e
-@pytest.mark.asyncio
 async def test_section_titles(tool: WikipediaTool) -> None:
     result = await tool.run(input=WikipediaToolInput(query="bee", section_titles=True))
     assert type(result) is WikipediaToolOutput
     assert "Characteristics" in result.get_text_content()
 
 
-@pytest.mark.e2e
-@pytest.mark.asyncio
 async def test_alternate_language(tool: WikipediaTool) -> None:
     result = await tool.run(input=WikipediaToolInput(query="bee", language="fr"))
     assert type(result) is WikipediaToolOutput
@@ -13,6 +13,8 @@
 # limitations under the License.
 
 
+import copy
+
 import pytest
 from pydantic import BaseModel
 
@@ -30,7 +32,7 @@ class DefaultUser:
         self.email = email
 
     async def clone(self) -> "DefaultUser":
-        return DefaultUser(self.name, self.age, self.email)
+        return copy.copy(self)
 
 
 class BaseModelUser(BaseModel):
@@ -39,7 +41,7 @@ class BaseModelUser(BaseModel):
     email: str | None = None
 
     async def clone(self) -> "BaseModelUser":
-        return BaseModelUser(**self.model_dump())
+        return self.model_copy()
 
 
 @pytest.fixture
@@ -25,7 +25,7 @@ Utility functions and classes
 """
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def test_json_schema() -> dict[str, list[str] | str | Any]:
     return {
         "title": "User",
@@ -48,19 +48,23 @@ def test_json_schema() -> dict[str, list[str] | str | Any]:
     }
 
 
+@pytest.fixture(scope="module")
+def test_schema_model(test_json_schema: dict[str, list[str] | str | Any]) -> type[JSONSchemaModel]:
+    return JSONSchemaModel.create("test_schema", test_json_schema)
+
+
 """
 Unit Tests
 """
 
 
 @pytest.mark.unit
-def test_json_schema_model(test_json_schema: dict[str, list[str] | str | Any]) -> None:
-    model = JSONSchemaModel.create("test_schema", test_json_schema)
-    assert model.model_json_schema()
+def test_json_schema_model(test_schema_model: type[JSONSchemaModel]) -> None:
+    assert test_schema_model.model_json_schema()
 
     # should throw exception if required fields are missing
     with pytest.raises(ValidationError):  # No description provided
-        model.model_validate({"name": "aaa"})
+        test_schema_model.model_validate({"name": "aaa"})
 
     # should not fail if optional fields are not included
-    assert model.model_validate({"name": "aaa", "age": 25})
+    assert test_schema_model.model_validate({"name": "aaa", "age": 25})
@@ -12,54 +12,63 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import os
+
+import httpx
 import pytest
 
 from beeai_framework.adapters.ollama import OllamaChatModel
 from beeai_framework.backend import UserMessage
-from beeai_framework.memory import UnconstrainedMemory
 from beeai_framework.workflows.agent import AgentWorkflow
 
+pytestmark = [pytest.mark.e2e, pytest.mark.asyncio(loop_scope="module")]
+
 """
-E2E Tests
+Utility functions and classes
 """
 
 
-@pytest.mark.e2e
-@pytest.mark.asyncio
-async def test_multi_agents_workflow_basic() -> None:
-    chat_model = OllamaChatModel()
+@pytest.fixture(scope="module")
+def chat_model() -> OllamaChatModel:
+    return OllamaChatModel()
+
 
+@pytest.fixture(scope="module")
+def require_ollama() -> None:
+    # Probe the server once so runs without Ollama skip quickly instead of waiting on connection timeouts
+    base_url = os.getenv("OLLAMA_API_BASE", "http://localhost:11434").removesuffix("/v1")
+    try:
+        httpx.get(f"{base_url}/api/tags", timeout=1).raise_for_status()
+    except httpx.HTTPError:
+        pytest.skip(f"Ollama server is not reachable at {base_url}")
+
+
+"""
+E2E Tests
+"""
+
+
+@pytest.mark.usefixtures("require_ollama")
+async def test_multi_agents_workflow_basic(chat_model: OllamaChatModel) -> None:
     workflow: AgentWorkflow = AgentWorkflow()
     workflow.add_agent(name="Translator assistant", tools=[], llm=chat_model)
 
-    memory = UnconstrainedMemory()
-    await memory.add(UserMessage(content="Translate 'Hello' to German."))
-    response = await workflow.run(memory.messages)
-    print(response.state)
-    assert "hallo" in response.state.final_answer.lower()
-
+    response = await workflow.run([UserMessage(content="Translate 'Hello' to German.")])
+    assert "hallo" in response.state.final_answer.lower(), response.state.final_answer
 
-@pytest.mark.e2e
-@pytest.mark.asyncio
-async def test_multi_agents_workflow_creation() -> None:
-    chat_model = OllamaChatModel()
 
+@pytest.mark.usefixtures("require_ollama")
+async def test_multi_agents_workflow_creation(chat_model: OllamaChatModel) -> None:
     workflow: AgentWorkflow = AgentWorkflow()
     workflow.add_agent(name="AgentA", llm=chat_model, instructions="You are a translator agent.")
     workflow.add_agent(name="AgentB", llm=chat_model, instructions="Summarize the final outcome.")
     assert len(workflow.workflow.step_names) == 2
 
-    memory = UnconstrainedMemory()
-    await memory.add(UserMessage(content="Translate 'Good morning' to Italian."))
-    response = await workflow.run(memory.messages)
+    response = await workflow.run([UserMessage(content="Translate 'Good morning' to Italian.")])
     assert "buongiorno" in response.state.final_answer.lower().replace(" ", "")
 
 
-@pytest.mark.e2e
-@pytest.mark.asyncio
-async def test_multi_agents_workflow_agent_delete() -> None:
-    chat_model = OllamaChatModel()
-
+async def test_multi_agents_workflow_agent_delete(chat_model: OllamaChatModel) -> None:
     workflow: AgentWorkflow = AgentWorkflow()
     workflow.add_agent(name="AgentA", llm=chat_model, tools=[])
     workflow.del_agent("AgentA")
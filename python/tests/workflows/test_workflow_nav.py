@@ -13,7 +13,7 @@
 # limitations under the License.
 
 import pytest
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict
 
 from beeai_framework.workflows import Workflow
 
@@ -27,12 +27,13 @@ Unit Tests
 async def test_workflow_nav() -> None:
     # State
     class State(BaseModel):
+        # Steps mutate the state on every hop; keep assignments unvalidated
+        model_config = ConfigDict(validate_assignment=False)
+
         hops: int
-        seq: list[str]
 
     # Steps
     async def first(state: State) -> str:
-        state.seq.append("first")
         state.hops += 1
         if state.hops < 5:
             return Workflow.SELF
@@ -40,7 +41,6 @@ async def test_workflow_nav() -> None:
             return Workflow.NEXT
 
     def second(state: State) -> str:
-        state.seq.append("second")
         if state.hops < 6:
             state.hops += 1
             return Workflow.SELF
@@ -52,5 +52,5 @@ async def test_workflow_nav() -> None:
     workflow: Workflow[State] = Workflow(schema=State)
     workflow.add_step("first", first)
     workflow.add_step("second", second)
-    response = await workflow.run(State(hops=0, seq=[]))
+    response = await workflow.run(State(hops=0))
     assert response.state.hops == 10